@@ -1,9 +1,9 @@
 import sys
 import signal
 
-from PyQt5.QtWidgets import QMainWindow, QApplication, QDesktopWidget
-from PyQt5.QtGui import QPainter, QPen, QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QApplication, QLabel
+from PyQt5.QtGui import QGuiApplication, QPainter, QPen, QColor, QPixmap
+from PyQt5.QtCore import Qt, QLine, QRect
 
 # Handle Ctrl+C signal
 signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -14,37 +14,71 @@ CROSSHAIR_THICKNESS = 2  # Thickness of the crosshair lines in pixels
 CROSSHAIR_COLOR = QColor(255, 0, 0)  # Color of the crosshair (RGB)
 
 
-class MainWindow(QMainWindow):
+def _makeCrosshairPen():
+    pen = QPen(CROSSHAIR_COLOR, CROSSHAIR_THICKNESS)  # Set color and width
+    pen.setStyle(Qt.SolidLine)
+    pen.setCapStyle(Qt.FlatCap)  # Don't extend lines past their end points
+    pen.setCosmetic(True)
+
+    return pen
+
+
+class MainWindow(QWidget):
+    _geometry = None  # Centered window geometry, computed once
+    _pen = _makeCrosshairPen()  # Shared by all windows, never modified
+
     def __init__(self):
         super(MainWindow, self).__init__()
 
-        self.main_window = MainWindow
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setWindowFlag(Qt.FramelessWindowHint)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint)  # Always on top
-        self.setWindowFlag(Qt.X11BypassWindowManagerHint)  # Non-movable, non-resizable
+        self.setWindowFlags(
+            Qt.FramelessWindowHint
+            | Qt.WindowStaysOnTopHint  # Always on top
+            | Qt.X11BypassWindowManagerHint  # Non-movable, non-resizable
+            | Qt.WindowTransparentForInput  # Mouse and keyboard pass through
+        )
 
-        self.setGeometry(*self.centerOnScreen(CROSSHAIR_SIZE, CROSSHAIR_SIZE))
+        if MainWindow._geometry is None:
+            MainWindow._geometry = self.centerOnScreen(CROSSHAIR_SIZE, CROSSHAIR_SIZE)
 
-    @staticmethod
-    def centerOnScreen(width, height):
-        resolution = QDesktopWidget().screenGeometry()
+        self.setGeometry(MainWindow._geometry)
+        self.setFixedSize(CROSSHAIR_SIZE, CROSSHAIR_SIZE)
 
-        return \
-            round(resolution.width() / 2) - round(width / 2), \
-            round(resolution.height() / 2) - round(height / 2), \
-            width, \
-            height
+        # Frame interval matching the screen refresh rate, for any future repaint timer
+        refresh_rate = QGuiApplication.primaryScreen().refreshRate() or 60.0
+        self._target_interval_ms = int(1000 / max(30.0, refresh_rate))
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setPen(QPen(CROSSHAIR_COLOR, CROSSHAIR_THICKNESS))  # Set color and width
+        # Render the crosshair once and let QLabel blit it, no Python paintEvent
+        self._pixmap = self.renderCrosshair(CROSSHAIR_SIZE, CROSSHAIR_SIZE, self._pen)
 
-        # Draw horizontal line
-        painter.drawLine(round(self.width() / 2), 0, round(self.width() / 2), self.height())
+        self._label = QLabel(self)
+        self._label.setPixmap(self._pixmap)
+        self._label.setGeometry(0, 0, CROSSHAIR_SIZE, CROSSHAIR_SIZE)
 
-        # Draw vertical line
-        painter.drawLine(0, round(self.height() / 2), self.width(), round(self.height() / 2))
+    @staticmethod
+    def centerOnScreen(width, height):
+        geometry = QRect(0, 0, width, height)
+        geometry.moveCenter(QGuiApplication.primaryScreen().geometry().center())
+
+        return geometry
+
+    @staticmethod
+    def renderCrosshair(width, height, pen):
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.transparent)
+
+        half_width, half_height = width // 2, height // 2
+        lines = [
+            QLine(half_width, 0, half_width, height),  # Vertical line
+            QLine(0, half_height, width, half_height),  # Horizontal line
+        ]
+
+        painter = QPainter(pixmap)
+        painter.setPen(pen)
+        painter.drawLines(lines)
+        painter.end()
+
+        return pixmap
 
 
 if __name__ == '__main__':